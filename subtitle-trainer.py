@@ -1,17 +1,178 @@
 import sys
+import os
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                            QHBoxLayout, QPushButton, QLabel, QFileDialog, 
-                           QTextEdit, QProgressBar, QMessageBox, QFrame, QSizePolicy)
+                           QTextEdit, QProgressBar, QMessageBox, QFrame, QSizePolicy,
+                           QCheckBox)
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QShortcut, QKeySequence, QFont, QPalette, QColor
 import pysrt
 from difflib import SequenceMatcher
+from zlib import crc32
+from itertools import groupby
 import nltk
 import re
 import spacy
+import numpy as np
 from translate import Translator
 
 
+# Word vectors exported once from en_core_web_md; every running instance maps
+# the same files so the operating system shares their physical pages.
+# SUBTITLE_TRAINER_VECTOR_DIR can point at a directory shared by all accounts
+# on a machine (it may be read-only); the home directory is the fallback.
+VECTOR_TABLE_ENV = 'SUBTITLE_TRAINER_VECTOR_DIR'
+VECTOR_TABLE_HOME = os.path.join(os.path.expanduser('~'), '.subtitle-trainer')
+VECTOR_WIDTH = 300  # en_core_web_md vectors are 300-dimensional
+
+
+def vector_table_dirs(version):
+    """Candidate table directories in order of preference"""
+    roots = [os.environ[VECTOR_TABLE_ENV]] if os.environ.get(VECTOR_TABLE_ENV) else []
+    roots.append(VECTOR_TABLE_HOME)
+    # One table per model version, so an upgraded model never reuses old vectors
+    return [os.path.join(root, f'en_core_web_md-{version}-vectors') for root in roots]
+
+
+class SharedVectorTable:
+    """Read-only, memory-mapped word vector table used for semantic similarity"""
+    
+    FILES = ('keys.npy', 'rows.npy', 'vectors.npy')
+    
+    def __init__(self, directory):
+        # mmap_mode='r' maps the files instead of reading them into memory
+        self.keys, self.rows, self.vectors = (
+            np.load(os.path.join(directory, name), mmap_mode='r') for name in self.FILES
+        )
+        if (self.keys.ndim != 1 or self.rows.shape != self.keys.shape or len(self.keys) == 0
+                or self.vectors.dtype != np.float32 or self.vectors.shape[1:] != (VECTOR_WIDTH,)
+                or self.rows.min() < 0 or self.rows.max() >= len(self.vectors)):
+            raise ValueError(f"Inconsistent vector table in {directory}")
+    
+    @classmethod
+    def exists(cls, directory):
+        return all(os.path.exists(os.path.join(directory, name)) for name in cls.FILES)
+    
+    @classmethod
+    def export(cls, nlp, directory):
+        """Write the spaCy model's vectors as sorted key/row lookup arrays plus the vector data"""
+        os.makedirs(directory, exist_ok=True)
+        key2row = nlp.vocab.vectors.key2row
+        
+        keys = np.fromiter(key2row.keys(), dtype=np.uint64, count=len(key2row))
+        rows = np.fromiter(key2row.values(), dtype=np.int64, count=len(key2row))
+        order = np.argsort(keys)
+        vectors = np.ascontiguousarray(nlp.vocab.vectors.data, dtype=np.float32)
+        
+        for name, array in zip(cls.FILES, (keys[order], rows[order], vectors)):
+            # Write to a temporary file first so other instances never map a partial table
+            path = os.path.join(directory, name)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_path, 'wb') as file:
+                    np.save(file, array)
+                os.replace(tmp_path, path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+    
+    def doc_vector(self, doc):
+        """Average of the token vectors, like spaCy's Doc.vector (unknown words count as zero)"""
+        if len(doc) == 0:
+            return np.zeros(self.vectors.shape[1], dtype=np.float32)
+        
+        orths = np.array([token.orth for token in doc], dtype=np.uint64)
+        idx = np.minimum(np.searchsorted(self.keys, orths), len(self.keys) - 1)
+        found = self.keys[idx] == orths
+        
+        total = self.vectors[self.rows[idx[found]]].sum(axis=0)
+        return total / len(doc)
+    
+    @staticmethod
+    def vector_similarity(vector1, vector2):
+        norm = np.linalg.norm(vector1) * np.linalg.norm(vector2)
+        if norm == 0:
+            return 0.0
+        return float(np.dot(vector1, vector2) / norm)
+
+
+def normalize_sentence(text):
+    """Lowercase, punctuation-free, single-spaced form used for comparison and grouping"""
+    # Remove punctuation and convert to lowercase
+    text = re.sub(r'[^\w\s]', '', text)
+    # Remove extra spaces and trim
+    return ' '.join(text.lower().split())
+
+
+class DuplicateIndex:
+    """Groups exact and near-duplicate sentences with MinHash signatures and LSH banding"""
+    
+    PRIME = (1 << 31) - 1
+    
+    def __init__(self, num_perm=64, bands=16, threshold=0.8, seed=1):
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+        self.threshold = threshold
+        rng = np.random.default_rng(seed)
+        self.a = rng.integers(1, self.PRIME, size=num_perm, dtype=np.uint64)
+        self.b = rng.integers(0, self.PRIME, size=num_perm, dtype=np.uint64)
+    
+    def shingles(self, text):
+        # Character 3-grams keep short lines like "what" comparable
+        padded = f" {text} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+    
+    def signature(self, shingles):
+        hashes = np.array([crc32(shingle.encode('utf-8')) % self.PRIME for shingle in shingles],
+                          dtype=np.uint64)
+        # a, b and hashes are below 2**31, so the products fit in uint64
+        return ((self.a[:, None] * hashes[None, :] + self.b[:, None]) % self.PRIME).min(axis=1)
+    
+    def group(self, texts):
+        """Return, for every text, the index of the first text in its duplicate group"""
+        normalized = [normalize_sentence(text) for text in texts]
+        
+        # Exact duplicates share a normalized form
+        first_by_form = {}
+        for i, form in enumerate(normalized):
+            first_by_form.setdefault(form, i)
+        
+        # Near duplicates: forms are visited in order of first occurrence and each one joins
+        # the representative it matches best, so every member is checked against the
+        # representative itself and groups never grow through chains of small edits
+        representative = {}
+        rep_shingles = {}
+        buckets = {}
+        for form in first_by_form:
+            if not form:
+                representative[form] = form
+                continue
+            
+            shingles = self.shingles(form)
+            signature = self.signature(shingles)
+            keys = [(band, signature[band * self.rows_per_band:(band + 1) * self.rows_per_band].tobytes())
+                    for band in range(self.bands)]
+            
+            best, best_score = None, self.threshold
+            for candidate in dict.fromkeys(c for key in keys for c in buckets.get(key, ())):
+                # Verify with the exact Jaccard similarity to drop LSH false positives
+                candidate_shingles = rep_shingles[candidate]
+                score = len(shingles & candidate_shingles) / len(shingles | candidate_shingles)
+                if score >= best_score:
+                    best, best_score = candidate, score
+            
+            if best is None:
+                # Only representatives go into the LSH buckets
+                representative[form] = form
+                rep_shingles[form] = shingles
+                for key in keys:
+                    buckets.setdefault(key, []).append(form)
+            else:
+                representative[form] = best
+        
+        return [first_by_form[representative[form]] for form in normalized]
+
+
 class SubtitleLearningApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -31,13 +192,40 @@ class SubtitleLearningApp(QMainWindow):
             nltk.download('punkt')
             
         # Initialize spaCy
-        try:
-            self.nlp = spacy.load('en_core_web_md')
-        except:
-            QMessageBox.information(self, "Model Yükleniyor", "İlk kullanım için dil modeli indiriliyor...")
-            import os
-            os.system('python -m spacy download en_core_web_md')
-            self.nlp = spacy.load('en_core_web_md')
+        # Installed model version, read from package metadata without loading the model
+        version = spacy.util.get_package_version('en_core_web_md')
+        self.vector_table = None
+        for table_dir in (vector_table_dirs(version) if version else []):
+            if SharedVectorTable.exists(table_dir):
+                try:
+                    self.vector_table = SharedVectorTable(table_dir)
+                    break
+                except (OSError, ValueError, EOFError):
+                    pass  # Bozuk tablo, aşağıda yeniden aktarılır
+        
+        if self.vector_table is None:
+            try:
+                nlp = spacy.load('en_core_web_md')
+            except:
+                QMessageBox.information(self, "Model Yükleniyor", "İlk kullanım için dil modeli indiriliyor...")
+                os.system('python -m spacy download en_core_web_md')
+                nlp = spacy.load('en_core_web_md')
+            
+            # Vektörleri bir kez diske aktar, sonraki açılışlar sadece dosyaları eşler
+            for table_dir in vector_table_dirs(nlp.meta['version']):
+                try:
+                    SharedVectorTable.export(nlp, table_dir)
+                    self.vector_table = SharedVectorTable(table_dir)
+                    break
+                except (OSError, ValueError, EOFError):
+                    continue  # Yazılamayan dizin (salt okunur, disk dolu), sıradakini dene
+        
+        if self.vector_table is not None:
+            # Only the tokenizer is needed; word vectors come from the shared table
+            self.nlp = spacy.blank('en')
+        else:
+            # Tablo hiçbir yere yazılamadı, modelin kendi vektörleri kullanılır
+            self.nlp = nlp
             
         # Set default window size based on screen size
         screen = QApplication.primaryScreen().size()
@@ -46,6 +234,9 @@ class SubtitleLearningApp(QMainWindow):
         # Initialize state
         self.sentence_data = []
         self.translations = {}
+        self.pending_parallel_cues = None
+        self.grading_cache = {}
+        self.duplicate_index = DuplicateIndex()
         self.current_index = 0
         self.show_answer = False
         self.total_duration = 0
@@ -88,12 +279,23 @@ class SubtitleLearningApp(QMainWindow):
         main_layout.setSpacing(1)
         main_layout.setContentsMargins(20, 20, 20, 20)
         
-        # File selection button
+        # File selection buttons
+        file_layout = QHBoxLayout()
+        file_layout.setSpacing(10)
+
         self.file_button = QPushButton("İngilizce Altyazı Seç (.srt)")
-        self.file_button.setFont(button_font)
-        self.file_button.setMinimumHeight(50)
         self.file_button.clicked.connect(self.load_subtitle_file)
-        main_layout.addWidget(self.file_button)
+
+        # Optional Turkish subtitle used as an offline translation source
+        self.parallel_file_button = QPushButton("Türkçe Altyazı Seç (.srt)")
+        self.parallel_file_button.clicked.connect(self.load_parallel_subtitle_file)
+
+        for button in [self.file_button, self.parallel_file_button]:
+            button.setFont(button_font)
+            button.setMinimumHeight(50)
+            file_layout.addWidget(button)
+
+        main_layout.addLayout(file_layout)
         
         # Progress frame
         progress_frame = QFrame()
@@ -310,9 +512,15 @@ class SubtitleLearningApp(QMainWindow):
         self.prev_button.clicked.connect(self.prev_sentence)
         self.next_button.clicked.connect(self.next_sentence)
         
+        # Skip sentences that repeat an earlier one while navigating
+        self.skip_duplicates_checkbox = QCheckBox("Tekrarları Atla")
+        self.skip_duplicates_checkbox.setFont(button_font)
+        self.skip_duplicates_checkbox.toggled.connect(lambda checked: self.update_ui())
+        
         nav_layout.addWidget(self.prev_button)
         nav_layout.addWidget(self.jump_input)
         nav_layout.addWidget(self.next_button)
+        nav_layout.addWidget(self.skip_duplicates_checkbox)
         main_layout.addLayout(nav_layout)
         
         # Shortcuts info
@@ -371,28 +579,28 @@ class SubtitleLearningApp(QMainWindow):
             return
                 
         answer = self.answer_input.toPlainText().strip()
-        current = self.sentence_data[self.current_index]['text'].strip()
+        current_sentence = self.sentence_data[self.current_index]
+        current = current_sentence['text'].strip()
         
         if answer and current:
-            # Remove punctuation and extra spaces for string comparison
-            def clean_text(text):
-                # Remove punctuation and convert to lowercase
-                text = re.sub(r'[^\w\s]', '', text)
-                # Remove extra spaces and trim
-                text = ' '.join(text.lower().split())
-                return text
-                    
-            clean_answer = clean_text(answer)
-            clean_current = clean_text(current)
+            # Remove punctuation and extra spaces for string comparison;
+            # this is also the key repeated sentences share translations and grading under
+            clean_answer = normalize_sentence(answer)
+            clean_current = self.translation_key(current_sentence)
                 
             # String similarity with cleaned text
             string_similarity = SequenceMatcher(None, clean_answer, clean_current).ratio()
                 
             # Semantic similarity with original text
             try:
-                doc1 = self.nlp(answer.lower())
-                doc2 = self.nlp(current.lower())
-                semantic_similarity = doc1.similarity(doc2)
+                if self.vector_table is None:
+                    semantic_similarity = self.nlp(answer.lower()).similarity(self.nlp(current.lower()))
+                else:
+                    # Hedef cümlenin vektörü tekrar eden cümleler arasında paylaşılır
+                    if clean_current not in self.grading_cache:
+                        self.grading_cache[clean_current] = self.vector_table.doc_vector(self.nlp(current.lower()))
+                    answer_vector = self.vector_table.doc_vector(self.nlp(answer.lower()))
+                    semantic_similarity = self.vector_table.vector_similarity(answer_vector, self.grading_cache[clean_current])
                 similarity_msg = f"String Benzerliği: {string_similarity:.1%}\nAnlamsal Benzerlik: {semantic_similarity:.1%}"
             except:
                 similarity_msg = f"String Benzerliği: {string_similarity:.1%}"
@@ -402,7 +610,7 @@ class SubtitleLearningApp(QMainWindow):
                 self.answer_label.setStyleSheet("color: #4CAF50;")
                     
                 QTimer.singleShot(1500, lambda: self.next_sentence() 
-                                if self.current_index < len(self.sentence_data) - 1 
+                                if self.find_sentence_index(1) is not None 
                                 else None)
                     
                 self.answer_input.clear()
@@ -452,27 +660,18 @@ class SubtitleLearningApp(QMainWindow):
             
             for encoding in encodings:
                 try:
-                    with open(file_name, 'r', encoding=encoding) as file:
-                        content = file.read()
-                        
-                    # BOM karakterlerini temizle
-                    if content.startswith('\ufeff'):
-                        content = content[1:]
-                    
-                    # Geçersiz karakterleri temizle
-                    content = ''.join(char for char in content if ord(char) < 65536)
-                    
-                    subs = pysrt.from_string(content)
+                    subs = self.read_subtitle_file(file_name, encoding)
                     
                     self.sentence_data = self.process_subtitles(subs)
                     
                     if self.sentence_data:
+                        self.group_duplicate_sentences()
+                        self.grading_cache = {}
                         self.total_duration = self.sentence_data[-1]['end_seconds']
                         self.current_index = 0
                         self.show_answer = False
                         self.update_ui()
-                        self.load_current_translation()
-                        return  # Başarılı okuma
+                        break  # Başarılı okuma
                     else:
                         continue  # Altyazı bulunamadı, diğer encoding'i dene
                         
@@ -480,11 +679,198 @@ class SubtitleLearningApp(QMainWindow):
                     continue  # Bu encoding ile açılamadı, diğerini dene
                 except Exception as e:
                     continue  # Diğer hatalar için de diğer encoding'i dene
+            else:
+                # Hiçbir encoding işe yaramadıysa
+                QMessageBox.critical(self, "Hata", 
+                    "Altyazı dosyası hiçbir karakter kodlaması ile açılamadı. "
+                    "Lütfen dosyanın bozuk olmadığından emin olun.")
+                return
+            
+            # Önceden seçilmiş ya da yanındaki Türkçe altyazı ilk çeviriden önce hizalanır
+            cues = self.pending_parallel_cues or self.find_sibling_parallel_cues(file_name)
+            self.pending_parallel_cues = None
+            self.parallel_file_button.setText("Türkçe Altyazı Seç (.srt)")
+            if cues:
+                self.apply_parallel_cues(cues)
+            
+            self.load_current_translation()
+            self.update_ui()
+
+    def read_subtitle_file(self, file_name, encoding):
+        with open(file_name, 'r', encoding=encoding) as file:
+            content = file.read()
+            
+        # BOM karakterlerini temizle
+        if content.startswith('\ufeff'):
+            content = content[1:]
+        
+        # Geçersiz karakterleri temizle
+        content = ''.join(char for char in content if ord(char) < 65536)
+        
+        return pysrt.from_string(content)
+
+    def load_parallel_subtitle_file(self):
+        file_name, _ = QFileDialog.getOpenFileName(
+            self,
+            "Select Turkish Subtitle File",
+            "",
+            "Subtitle Files (*.srt)"
+        )
+        
+        if file_name:
+            cues = self.read_parallel_cues(file_name)
+            if not cues:
+                QMessageBox.critical(self, "Hata", 
+                    "Türkçe altyazı dosyası hiçbir karakter kodlaması ile açılamadı. "
+                    "Lütfen dosyanın bozuk olmadığından emin olun.")
+                return
+            
+            if not self.sentence_data:
+                # İngilizce altyazı yüklenince, ilk çeviriden önce hizalanır
+                self.pending_parallel_cues = cues
+                self.parallel_file_button.setText(f"Türkçe Altyazı: {os.path.basename(file_name)}")
+                return
+            
+            self.apply_parallel_cues(cues)
+            self.load_current_translation()
+            self.update_ui()
+
+    def read_parallel_cues(self, file_name):
+        """Decode and parse a Turkish subtitle file, returns its cues or None"""
+        # Türkçe altyazılar genellikle cp1254 / iso-8859-9 ile kaydedilir
+        encodings = ['utf-8', 'utf-8-sig', 'cp1254', 'iso-8859-9', 
+                    'utf-16', 'utf-32']
+        
+        for encoding in encodings:
+            try:
+                cues = self.build_parallel_cues(self.read_subtitle_file(file_name, encoding))
+            except UnicodeDecodeError:
+                continue
+            except Exception as e:
+                continue
+            
+            if cues:
+                return cues
+        
+        return None
+
+    def find_sibling_parallel_cues(self, file_name):
+        """Look for a Turkish subtitle next to the English one (movie.srt / movie.en.srt -> movie.tr.srt)"""
+        stem = re.sub(r'\.(en|eng|english)$', '', os.path.splitext(file_name)[0], flags=re.IGNORECASE)
+        for suffix in ('.tr.srt', '.tur.srt', '.turkish.srt'):
+            if os.path.exists(stem + suffix):
+                return self.read_parallel_cues(stem + suffix)
+        return None
+
+    def apply_parallel_cues(self, cues):
+        try:
+            aligned = self.align_parallel_subtitles(cues)
+        except Exception as e:
+            QMessageBox.critical(self, "Hizalama Hatası", 
+                f"Türkçe altyazı İngilizce cümlelerle hizalanamadı: {e}")
+            return
+        
+        message = f"{len(self.sentence_data)} cümleden {aligned} tanesi hizalandı."
+        if aligned < len(self.sentence_data):
+            message += " Hizalanamayan cümleler için çevrimiçi çeviri kullanılacak."
+        QMessageBox.information(self, "Türkçe Altyazı", message)
+
+    def build_parallel_cues(self, subs):
+        """Build a start-sorted list of (start_ms, end_ms, text) cues for interval lookups"""
+        cues = []
+        for sub in subs:
+            text = sub.text.replace('\n', ' ')
+            # Remove sound effects and formatting tags
+            text = re.sub(r'\([^)]*\)', '', text)
+            text = re.sub(r'\[[^\]]*\]', '', text)
+            text = re.sub(r'</?[a-zA-Z][^>]*>', '', text)
+            text = ' '.join(text.split())
+            
+            if text:
+                cues.append((sub.start.ordinal, sub.end.ordinal, text))
+        
+        cues.sort()
+        return cues
+
+    def align_parallel_subtitles(self, cues):
+        """Attach the overlapping Turkish cues to every sentence, returns the aligned count"""
+        # Sentences NLTK split out of one cue group share its time interval
+        blocks = [list(block) for _, block in groupby(
+            self.sentence_data, key=lambda sentence: (sentence['start_ms'], sentence['end_ms']))]
+        blocks.sort(key=lambda block: block[0]['start_ms'])
+        
+        # Sweep both start-sorted lists; only cues still running stay active,
+        # so one long cue costs one extra check per sentence it spans
+        translations = {}
+        active = []
+        next_cue = 0
+        for block in blocks:
+            start, end = block[0]['start_ms'], block[0]['end_ms']
+            
+            while next_cue < len(cues) and cues[next_cue][0] < end:
+                active.append(cues[next_cue])
+                next_cue += 1
+            active = [cue for cue in active if cue[1] > start]
+            
+            texts = []
+            fallback, fallback_overlap = None, 0
+            for cue_start, cue_end, text in active:
+                overlap = min(end, cue_end) - max(start, cue_start)
+                if overlap <= 0:
+                    continue
+                if overlap * 2 >= cue_end - cue_start:
+                    # Most of the cue falls inside the sentence
+                    texts.append(text)
+                elif (overlap * 2 >= end - start and overlap > fallback_overlap
+                        and cue_end - cue_start <= 3 * (end - start)):
+                    # A cue covering the sentence, unless it is a long sign/credits cue
+                    fallback, fallback_overlap = text, overlap
+            
+            if not texts and fallback:
+                texts = [fallback]
+            
+            if not texts:
+                continue
             
-            # Hiçbir encoding işe yaramadıysa
-            QMessageBox.critical(self, "Hata", 
-                "Altyazı dosyası hiçbir karakter kodlaması ile açılamadı. "
-                "Lütfen dosyanın bozuk olmadığından emin olun.")
+            translation = ' '.join(texts)
+            if len(block) == 1:
+                pieces = [translation]
+            else:
+                # Split the Turkish text the same way and match the pieces by position
+                pieces = nltk.sent_tokenize(translation, language='turkish')
+                if len(pieces) != len(block):
+                    continue  # Güvenilir eşleşme yok, çevrimiçi çeviriye bırak
+            
+            for sentence, piece in zip(block, pieces):
+                translations[id(sentence)] = piece
+        
+        # Hizalanamayan cümleler birebir aynı cümlenin çevirisini kullanabilir
+        form_translations = {}
+        for sentence in self.sentence_data:
+            if id(sentence) in translations:
+                form_translations.setdefault(self.translation_key(sentence), translations[id(sentence)])
+        
+        # Replace the previous alignment only once the new one is complete
+        aligned = 0
+        for sentence in self.sentence_data:
+            sentence.pop('parallel_translation', None)
+            translation = translations.get(id(sentence), form_translations.get(self.translation_key(sentence)))
+            if translation is not None:
+                sentence['parallel_translation'] = translation
+                aligned += 1
+        
+        return aligned
+
+    def group_duplicate_sentences(self):
+        """Tag every sentence with the index of the first exact or near-duplicate occurrence (used for skipping)"""
+        groups = self.duplicate_index.group([sentence['text'] for sentence in self.sentence_data])
+        for sentence, group in zip(self.sentence_data, groups):
+            sentence['group'] = group
+
+    def translation_key(self, sentence):
+        # Sadece normalize edilmiş hali aynı olan cümleler çeviri paylaşır;
+        # benzer ama anlamı farklı olabilecek cümleler ("not", tek kelime) ayrı çevrilir
+        return normalize_sentence(sentence['text'])
 
 # Önce gerekli kütüphaneyi kurmamız gerekiyor:
 # pip install transformers sentencepiece
@@ -496,7 +882,13 @@ class SubtitleLearningApp(QMainWindow):
         current_sentence = self.sentence_data[self.current_index]
         current_sentence['text'] = current_sentence['text'].replace('\n', ' ')
         
-        if current_sentence['text'] not in self.translations:
+        # Türkçe altyazıdan hizalanmış çeviri varsa ağa gitmeye gerek yok
+        if 'parallel_translation' in current_sentence:
+            return
+        
+        key = self.translation_key(current_sentence)
+        
+        if key not in self.translations:
             try:
                 
                 # Çevirmen nesnesini oluştur
@@ -506,14 +898,14 @@ class SubtitleLearningApp(QMainWindow):
                 translation = translator.translate(current_sentence['text'])
                 
                 if translation:
-                    self.translations[current_sentence['text']] = translation
+                    self.translations[key] = translation
                 else:
-                    self.translations[current_sentence['text']] = "Çeviri yapılamadı."
+                    self.translations[key] = "Çeviri yapılamadı."
                     
             except Exception as e:
                 QMessageBox.warning(self, "Çeviri Hatası", 
                     "Çeviri yapılamadı. Lütfen internet bağlantınızı kontrol edin.")
-                self.translations[current_sentence['text']] = "Çeviri hatası oluştu."
+                self.translations[key] = "Çeviri hatası oluştu."
             
             self.update_ui()
     def update_ui(self):
@@ -524,8 +916,15 @@ class SubtitleLearningApp(QMainWindow):
         current_sentence = self.sentence_data[self.current_index]
         
         # Update progress
-        self.progress_label.setText(f"İlerleme: {self.current_index + 1}/{total_sentences}")
-        self.progress_bar.setValue(int((self.current_index + 1) / total_sentences * 100))
+        if self.skip_duplicates_checkbox.isChecked():
+            # Atlanan tekrarlar ilerlemede sayılmaz
+            practiced = [i for i, sentence in enumerate(self.sentence_data) if sentence['group'] == i]
+            total_sentences = len(practiced)
+            position = sum(1 for i in practiced if i <= self.current_index)
+        else:
+            position = self.current_index + 1
+        self.progress_label.setText(f"İlerleme: {position}/{total_sentences}")
+        self.progress_bar.setValue(int(position / total_sentences * 100))
         
         # Update time progress
         current_time = current_sentence['start_seconds']
@@ -536,8 +935,11 @@ class SubtitleLearningApp(QMainWindow):
         self.time_label.setText(f"⏱️ {current_sentence['start']} → {self.format_seconds_to_time(self.total_duration)}")
         
         # Update translation
-        if current_sentence['text'] in self.translations:
-            self.translation_label.setText(self.translations[current_sentence['text']])
+        if 'parallel_translation' in current_sentence:
+            self.translation_label.setText(current_sentence['parallel_translation'])
+            self.translation_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        elif self.translation_key(current_sentence) in self.translations:
+            self.translation_label.setText(self.translations[self.translation_key(current_sentence)])
             self.translation_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         # Show/hide answer
@@ -550,23 +952,34 @@ class SubtitleLearningApp(QMainWindow):
         self.words_label.clear()
         
         # Update navigation buttons
-        self.prev_button.setEnabled(self.current_index > 0)
-        self.next_button.setEnabled(self.current_index < total_sentences - 1)
+        self.prev_button.setEnabled(self.find_sentence_index(-1) is not None)
+        self.next_button.setEnabled(self.find_sentence_index(1) is not None)
         
         # Focus on input
         self.answer_input.setFocus()
    
+    def find_sentence_index(self, step):
+        """Next index in the given direction, skipping repeated sentences when enabled"""
+        index = self.current_index + step
+        while 0 <= index < len(self.sentence_data):
+            if not self.skip_duplicates_checkbox.isChecked() or self.sentence_data[index]['group'] == index:
+                return index
+            index += step
+        return None
+
     def next_sentence(self):
-        if self.current_index < len(self.sentence_data) - 1:
-            self.current_index += 1
+        index = self.find_sentence_index(1)
+        if index is not None:
+            self.current_index = index
             self.show_answer = False
             self.answer_input.clear()
             self.load_current_translation()
             self.update_ui()
 
     def prev_sentence(self):
-        if self.current_index > 0:
-            self.current_index -= 1
+        index = self.find_sentence_index(-1)
+        if index is not None:
+            self.current_index = index
             self.show_answer = False
             self.answer_input.clear()
             self.load_current_translation()
@@ -646,7 +1059,8 @@ class SubtitleLearningApp(QMainWindow):
             if current_sentence_start is None:
                 current_sentence_start = {
                     'start': str(sub.start).split(',')[0],
-                    'start_seconds': self.get_time_in_seconds(str(sub.start).split(',')[0])
+                    'start_seconds': self.get_time_in_seconds(str(sub.start).split(',')[0]),
+                    'start_ms': sub.start.ordinal
                 }
             
             combined_text += " " + text
@@ -658,7 +1072,9 @@ class SubtitleLearningApp(QMainWindow):
                     'start': current_sentence_start['start'],
                     'end': str(sub.end).split(',')[0],
                     'start_seconds': current_sentence_start['start_seconds'],
-                    'end_seconds': self.get_time_in_seconds(str(sub.end).split(',')[0])
+                    'end_seconds': self.get_time_in_seconds(str(sub.end).split(',')[0]),
+                    'start_ms': current_sentence_start['start_ms'],
+                    'end_ms': sub.end.ordinal
                 })
                 combined_text = ""
                 current_sentence_start = None
@@ -670,7 +1086,9 @@ class SubtitleLearningApp(QMainWindow):
                 'start': current_sentence_start['start'],
                 'end': str(subs[-1].end).split(',')[0],
                 'start_seconds': current_sentence_start['start_seconds'],
-                'end_seconds': self.get_time_in_seconds(str(subs[-1].end).split(',')[0])
+                'end_seconds': self.get_time_in_seconds(str(subs[-1].end).split(',')[0]),
+                'start_ms': current_sentence_start['start_ms'],
+                'end_ms': subs[-1].end.ordinal
             })
         
         # Now split into proper sentences using NLTK
@@ -684,7 +1102,9 @@ class SubtitleLearningApp(QMainWindow):
                         'start': sub['start'],
                         'end': sub['end'],
                         'start_seconds': sub['start_seconds'],
-                        'end_seconds': sub['end_seconds']
+                        'end_seconds': sub['end_seconds'],
+                        'start_ms': sub['start_ms'],
+                        'end_ms': sub['end_ms']
                     })
         
         return sentence_data